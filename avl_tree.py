@@ -4,7 +4,7 @@
 An ordered dictionary keyed by an ʻōlelo Hawaiʻi proverb (string) implemented
 as an AVL. 
 
-The key comparator honours the Hawaiian collation order
+Keys are compared under the Hawaiian collation order
 ʻ a ā e ē i ī o ō u ū h k l m n p w
 so okina (ʻ) sorts before any alpha and kahakō (ā, ē, …) sort
 immediately after their short vowel counterparts.
@@ -16,7 +16,7 @@ Author: Jaeke Barkin
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
 from typing import Any, Callable, Generator, Iterable, Optional, Tuple, TypeVar, Union
 
 
@@ -30,27 +30,60 @@ _HAW_ALPHABET = [
     "h", "k", "l", "m", "n", "p", "w",
 ]
 
-_HAW_ORDER = {c: i for i, c in enumerate(_HAW_ALPHABET)}
-_MAX_ORDER = len(_HAW_ALPHABET)
+class _TranslateTable(dict):
+    """Codepoint → rank-codepoint table; unknown characters sort last."""
 
-def _hawaiian_key(string: str):
-    """Return a tuple usable as a sort key under Hawaiian alphabetical order."""
-    return tuple(_HAW_ORDER.get(ch.lower(), _MAX_ORDER) for ch in string)
+    def __missing__(self, codepoint):
+        return _UNKNOWN_RANK
 
 
-def _hawaiian_compare(a: str, b: str):
-    """Like (a > b) – (a < b) following Hawaiian collation."""
-    ka, kb = _hawaiian_key(a), _hawaiian_key(b)
-    return (ka > kb) - (ka < kb)
+# Map each alphabet character (both cases) to a low codepoint in collation
+# order, so str.translate produces a natively comparable key in one C pass.
+_TRANSLATE = _TranslateTable()
+for _i, _c in enumerate(_HAW_ALPHABET):
+    _TRANSLATE[ord(_c)] = ord(" ") + _i
+    _TRANSLATE[ord(_c.upper())] = ord(" ") + _i
+_UNKNOWN_RANK = ord(" ") + len(_HAW_ALPHABET)
+
+
+def _hawaiian_key(string: str, _translate=str.translate, _table=_TRANSLATE,
+                  _encode=str.encode):
+    """Return a bytes key that compares under Hawaiian alphabetical order.
+
+    Every rank codepoint fits in one byte, so after the translate pass the
+    key is packed down to bytes – one byte per character, compared by
+    memcmp rather than the richer str machinery.  The table and methods
+    are baked in as defaults at import time, so a call does no global or
+    attribute lookups.
+    """
+    return _encode(_translate(string, _table), "latin-1")
 
 
-@dataclass(slots=True, frozen=True)
 class Saying:
-    """Container for a single ʻōlelo noʻeau entry."""
-    olelo_haw: str                 # canonical Hawaiian text (key)
-    translation_en: str            # English translation
-    explanation_haw: str           # optional… may be empty
-    explanation_en: str
+    """Container for a single ʻōlelo noʻeau entry.
+
+    A plain __slots__ class rather than a dataclass: construction is just
+    five slot stores, with none of the generated __eq__/__hash__/__repr__
+    machinery or the frozen-dataclass object.__setattr__ detour.
+    """
+
+    __slots__ = (
+        "olelo_haw",        # canonical Hawaiian text (key)
+        "translation_en",   # English translation
+        "explanation_haw",  # optional… may be empty
+        "explanation_en",
+        "_sortkey",
+    )
+
+    def __init__(self, olelo_haw: str, translation_en: str,
+                 explanation_haw: str, explanation_en: str):
+        self.olelo_haw = olelo_haw
+        self.translation_en = translation_en
+        self.explanation_haw = explanation_haw
+        self.explanation_en = explanation_en
+        # Sort key under Hawaiian collation, computed once at construction
+        # so tree comparisons never re-tokenise the string.
+        self._sortkey = _hawaiian_key(olelo_haw)
 
     @property
     def key(self):  # alias for clarity
@@ -62,103 +95,254 @@ class Saying:
 
 
 S = TypeVar("S", bound="Saying")
-Comparator = Callable[[str, str], int]
-
-
-class _AVLNode:
-    __slots__ = ("key", "value", "left", "right", "height")
-
-    def __init__(self, key: str, value: Saying):
-        self.key: str = key
-        self.value: Saying = value
-        self.left: Optional[_AVLNode] = None
-        self.right: Optional[_AVLNode] = None
-        self.height: int = 1  # leaf ≡ height 1
-
-    def _update_height(self):
-        lh = self.left.height if self.left else 0
-        rh = self.right.height if self.right else 0
-        self.height = max(lh, rh) + 1
-
-    def _balance_factor(self):
-        return (self.left.height if self.left else 0) - (
-            self.right.height if self.right else 0
-        )
 
 
 class AVLDict:
+    """AVL tree stored as parallel arrays (a struct-of-arrays arena).
 
-    def __init__(self, comparator: Comparator | None = None):
-        self._root: Optional[_AVLNode] = None
+    Node *i* lives at slot *i* of every arena: ``_left[i]``/``_right[i]``
+    hold child slots (−1 ≡ no child), ``_bf[i]`` the balance factor and
+    ``_keys[i]``/``_values[i]`` the precomputed sort key and the Saying.
+    Traversal is array indexing on dense int32/int8 buffers instead of
+    chasing per-node heap objects, which keeps hot paths cache-friendly.
+    """
+
+    def __init__(self):
+        self._root_idx: int = -1
         self._size: int = 0
-        # Default comparator is Hawaiian alphabetical order.
-        self._cmp: Comparator = comparator or _hawaiian_compare
+        # — node arenas; slot i across all five is one node —
+        self._left = array("i")
+        self._right = array("i")
+        self._bf = array("b")  # left height − right height, in {-1, 0, +1}
+        self._keys: list = []
+        self._values: list[Saying] = []
+        # Reusable traversal stack so hot iteration does not regrow a list
+        # from scratch each call; None while an iteration has it claimed.
+        self._iter_buf: Optional[list[int]] = []
 
     def __len__(self):
         return self._size
 
     def __contains__(self, key: str):  # Member()
-        return self._find_node(key) is not None
+        return self._find_slot(key) >= 0
 
     def __getitem__(self, key: str):
-        node = self._find_node(key)
-        if node is None:
+        i = self._find_slot(key)
+        if i < 0:
             raise KeyError(key)
-        return node.value
-    
-    def insert(self, value: Saying):  # Insert()
-        """Insert or replace *value* keyed by its olelo_haw string."""
-        def _insert(node: Optional[_AVLNode], key: str, val: Saying) -> _AVLNode:
-            if node is None:
-                self._size += 1
-                return _AVLNode(key, val)
-            c = self._cmp(key, node.key)
-            if c < 0:
-                node.left = _insert(node.left, key, val)
-            elif c > 0:
-                node.right = _insert(node.right, key, val)
-            else:  # replace existing
-                node.value = val  # type: ignore[attr-defined]
-                return node
-            return self._rebalance(node)
-
-        self._root = _insert(self._root, value.key, value)
+        return self._values[i]
+
+    def _new_node(self, key, value: Saying):
+        """Append a leaf to the arenas and return its slot."""
+        idx = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._bf.append(0)
+        self._size += 1
+        return idx
 
+    def insert(self, value: Saying):  # Insert()
+        """Insert or replace *value* keyed by its olelo_haw string.
+
+        Implemented as an iterative path-walk: descend recording the
+        (parent, direction) path on a stack, attach the new leaf, then walk
+        back up nudging each ancestor's balance factor by ±1.  The climb
+        stops as soon as a factor hits 0 (growth absorbed) or a single
+        rebalance restores the pre-insert subtree height.
+        """
+        key = value._sortkey
+        if self._root_idx < 0:
+            self._root_idx = self._new_node(key, value)
+            return
+
+        left, right, bf, keys = self._left, self._right, self._bf, self._keys
+
+        # — walk down, remembering the path —
+        path: list[Tuple[int, bool]] = []
+        i = self._root_idx
+        while True:
+            nk = keys[i]  # one arena load per level, not two
+            if key == nk:  # replace existing
+                self._values[i] = value
+                return
+            went_left = key < nk
+            path.append((i, went_left))
+            child = left[i] if went_left else right[i]
+            if child < 0:
+                break
+            i = child
+        if went_left:
+            left[i] = self._new_node(key, value)
+        else:
+            right[i] = self._new_node(key, value)
+
+        # — walk back up adjusting balance factors —
+        while path:
+            parent, went_left = path.pop()
+            b = bf[parent] + (1 if went_left else -1)
+            if b == 0:
+                bf[parent] = 0
+                return  # growth absorbed – ancestors unaffected
+            if b in (-1, 1):
+                bf[parent] = b
+                continue  # subtree grew by one level; keep climbing
+            # |bf| == 2 – one rebalance restores the pre-insert height
+            bf[parent] = b
+            new = self._rebalance(parent)
+            if path:
+                grand, grand_left = path[-1]
+                if grand_left:
+                    left[grand] = new
+                else:
+                    right[grand] = new
+            else:
+                self._root_idx = new
+            return
+
+
+    def bulk_load(self, sayings: Iterable[Saying]):
+        """Replace the contents with *sayings* in one linear-time build.
+
+        The input is sorted once by Hawaiian key and turned straight into a
+        perfectly balanced tree by midpoint splitting – no per-item descent
+        and zero rotations, versus Θ(n log n) for repeated insert.  Later
+        duplicates win, matching insert's replacement behaviour.
+        """
+        items = sorted(sayings, key=lambda s: s._sortkey)
+        unique: list[Saying] = []
+        for s in items:
+            if unique and unique[-1]._sortkey == s._sortkey:
+                unique[-1] = s  # replace, as insert would
+            else:
+                unique.append(s)
+        self._build_eytzinger([(s._sortkey, s) for s in unique])
+
+    def rebalance_eytzinger(self):
+        """Re-lay the arena in Eytzinger (BFS) order.
+
+        Node *k*'s children land at slots ``2k+1``/``2k+2``, so each tree
+        level occupies a contiguous stretch of the arrays and random
+        root-to-leaf descents touch prefetcher-friendly addresses.  Only
+        worthwhile while the set is static; bulk_load applies it
+        automatically.
+        """
+        pairs = []
+        left, right = self._left, self._right
+        stack: list[int] = []
+        i = self._root_idx
+        while stack or i >= 0:
+            if i >= 0:
+                stack.append(i)
+                i = left[i]
+            else:
+                i = stack.pop()
+                pairs.append((self._keys[i], self._values[i]))
+                i = right[i]
+        self._build_eytzinger(pairs)
+
+    def _build_eytzinger(self, pairs):
+        """Rebuild the arenas from sorted (key, value) pairs, slot k's
+        children at 2k+1 and 2k+2.  Θ(n), zero rotations."""
+        n = len(pairs)
+        # a midpoint-split tree over n items has height n.bit_length()
+        m = (1 << n.bit_length()) - 1
+        left = array("i", [-1]) * m
+        right = array("i", [-1]) * m
+        bf = array("b", bytes(m))
+        keys: list = [None] * m
+        values: list = [None] * m
+
+        def place(lo: int, hi: int, k: int):  # → subtree height
+            if lo >= hi:
+                return 0
+            mid = (lo + hi) // 2
+            keys[k], values[k] = pairs[mid]
+            lh = place(lo, mid, 2 * k + 1)
+            rh = place(mid + 1, hi, 2 * k + 2)
+            if lh:
+                left[k] = 2 * k + 1
+            if rh:
+                right[k] = 2 * k + 2
+            bf[k] = lh - rh
+            return max(lh, rh) + 1
+
+        place(0, n, 0)
+        self._root_idx = 0 if n else -1
+        self._size = n
+        self._left = left
+        self._right = right
+        self._bf = bf
+        self._keys = keys
+        self._values = values
 
     def first(self):  # First()
-        node = self._min_node(self._root)
-        return node.value if node else None
+        i = self._root_idx
+        if i < 0:
+            return None
+        left = self._left
+        while left[i] >= 0:
+            i = left[i]
+        return self._values[i]
 
     def last(self):  # Last()
-        node = self._max_node(self._root)
-        return node.value if node else None
+        i = self._root_idx
+        if i < 0:
+            return None
+        right = self._right
+        while right[i] >= 0:
+            i = right[i]
+        return self._values[i]
 
     def predecessor(self, key: str):  # Predecessor()
-        pred = None
-        node = self._root
-        while node:
-            c = self._cmp(key, node.key)
-            if c <= 0:
-                node = node.left
+        sk = _hawaiian_key(key)  # keyed once – the arena holds precomputed keys
+        keys, left, right = self._keys, self._left, self._right
+        pred = -1
+        i = self._root_idx
+        while i >= 0:
+            if sk <= keys[i]:
+                i = left[i]
             else:
-                pred = node
-                node = node.right
-        return pred.value if pred else None
+                pred = i
+                i = right[i]
+        return self._values[pred] if pred >= 0 else None
 
     def successor(self, key: str):  # Successor()
-        succ = None
-        node = self._root
-        while node:
-            c = self._cmp(key, node.key)
-            if c < 0:
-                succ = node
-                node = node.left
+        sk = _hawaiian_key(key)
+        keys, left, right = self._keys, self._left, self._right
+        succ = -1
+        i = self._root_idx
+        while i >= 0:
+            if sk < keys[i]:
+                succ = i
+                i = left[i]
             else:
-                node = node.right
-        return succ.value if succ else None
+                i = right[i]
+        return self._values[succ] if succ >= 0 else None
 
     def __iter__(self):
-        yield from self._inorder(self._root)
+        # Iterative in-order walk – one shared generator frame instead of a
+        # recursive generator (and a resume) per node.
+        values, left, right = self._values, self._left, self._right
+        stack = self._iter_buf
+        if stack is None:
+            stack = []  # nested iteration – fall back to a fresh stack
+        else:
+            self._iter_buf = None  # claim the shared buffer
+        try:
+            i = self._root_idx
+            while stack or i >= 0:
+                if i >= 0:
+                    stack.append(i)
+                    i = left[i]
+                else:
+                    i = stack.pop()
+                    yield values[i]
+                    i = right[i]
+        finally:
+            stack.clear()
+            self._iter_buf = stack
 
     def keys(self):
         for saying in self:
@@ -167,79 +351,77 @@ class AVLDict:
     def values(self):
         yield from self
 
-    def _find_node(self, key: str):
-        node = self._root
-        while node:
-            c = self._cmp(key, node.key)
-            if c == 0:
-                return node
-            node = node.left if c < 0 else node.right
-        return None
-
-    @staticmethod
-    def _inorder(node):
-        if node is not None:
-            yield from AVLDict._inorder(node.left)
-            yield node.value
-            yield from AVLDict._inorder(node.right)
-
-    @staticmethod
-    def _min_node(node):
-        if node is None:
-            return None
-        while node.left:
-            node = node.left
-        return node
-
-    @staticmethod
-    def _max_node(node):
-        if node is None:
-            return None
-        while node.right:
-            node = node.right
-        return node
-
-    def _rebalance(self, node: _AVLNode):
-        node._update_height()
-        balance = node._balance_factor()
-        if balance > 1:
+    def _find_slot(self, key: str):
+        """Return the arena slot holding *key*, or −1 if absent."""
+        sk = _hawaiian_key(key)
+        keys, left, right = self._keys, self._left, self._right
+        i = self._root_idx
+        while i >= 0:
+            nk = keys[i]
+            if sk == nk:
+                return i
+            i = left[i] if sk < nk else right[i]
+        return -1
+
+    def _rebalance(self, i: int):
+        """Rotate a node whose balance factor has reached ±2 back into shape.
+
+        The new balance factors come straight from the classical AVL
+        rebalance table keyed on the child's factor – no heights are ever
+        recomputed.
+        """
+        left, right, bf = self._left, self._right, self._bf
+        if bf[i] > 1:
             # left heavy
-            if node.left and node.left._balance_factor() < 0:
-                node.left = self._rotate_left(node.left)
-            return self._rotate_right(node)
-        if balance < -1:
+            y = left[i]
+            if bf[y] < 0:  # left-right: double rotation, x ends up on top
+                x = right[y]
+                left[i] = self._rotate_left(y)
+                new = self._rotate_right(i)
+                bf[i] = -1 if bf[x] > 0 else 0
+                bf[y] = 1 if bf[x] < 0 else 0
+                bf[x] = 0
+                return new
+            # left-left: single rotation
+            new = self._rotate_right(i)
+            bf[i] = 1 - bf[y]
+            bf[y] -= 1
+            return new
+        if bf[i] < -1:
             # right heavy
-            if node.right and node.right._balance_factor() > 0:
-                node.right = self._rotate_right(node.right)
-            return self._rotate_left(node)
-        return node
-
-    @staticmethod
-    def _rotate_left(z: _AVLNode):
-        y = z.right
-        if y is None:
+            y = right[i]
+            if bf[y] > 0:  # right-left: double rotation, x ends up on top
+                x = left[y]
+                right[i] = self._rotate_right(y)
+                new = self._rotate_left(i)
+                bf[i] = 1 if bf[x] < 0 else 0
+                bf[y] = -1 if bf[x] > 0 else 0
+                bf[x] = 0
+                return new
+            # right-right: single rotation
+            new = self._rotate_left(i)
+            bf[i] = -1 - bf[y]
+            bf[y] += 1
+            return new
+        return i
+
+    def _rotate_left(self, z: int):
+        left, right = self._left, self._right
+        y = right[z]
+        if y < 0:
             return z  # should not happen
-        T2 = y.left
-        # perform rotation
-        y.left = z
-        z.right = T2
-        # update heights
-        z._update_height()
-        y._update_height()
+        # pure pointer swap – balance factors are patched by _rebalance
+        right[z] = left[y]
+        left[y] = z
         return y
 
-    @staticmethod
-    def _rotate_right(z: _AVLNode):
-        y = z.left
-        if y is None:
+    def _rotate_right(self, z: int):
+        left, right = self._left, self._right
+        y = left[z]
+        if y < 0:
             return z
-        T3 = y.right
-        # perform rotation
-        y.right = z
-        z.left = T3
-        # update heights
-        z._update_height()
-        y._update_height()
+        left[z] = right[y]
+        right[y] = z
         return y
 
 
@@ -259,8 +441,8 @@ def demo():
         Saying("ʻIke aku, ʻike mai, kōkua aku, kōkua mai; pela ihola ka nohona ʻohana",
                "Recognise others, be recognised, help others, be helped – the family way", "",""),
     ]
+    tree.bulk_load(sample)  # linear-time balanced build
     for s in sample:
-        tree.insert(s)
         print("Inserted:", s.key)
 
     # — IN-ORDER ITERATION —
@@ -2,11 +2,49 @@
 
 # Author: Jaeke Barkin & Michaela Gillan
 
-from avl_tree import AVLDict, Saying
-from sayings import index_saying, mehua, withword
+import os
+
+try:
+    import readline
+except ImportError:  # e.g. Windows – completion is a nicety, not a requirement
+    readline = None
+
+from avl_tree import Saying
+from saying_dict import SayingDict
+from sayings import (index_saying, mehua, withword, search_multi,
+                     non_english_index, english_index)
+
+_HISTORY_FILE = os.path.expanduser("~/.olelo_search_history")
+_MODES = ("mehua", "withword", "search", "quit")
+
+def _setup_readline():
+    """Enable tab completion over the indexed vocabulary plus history."""
+    if readline is None:
+        return
+
+    def completer(text, state):
+        opts = [m for m in _MODES if m.startswith(text)]
+        opts += [w for w in non_english_index if w.startswith(text)]
+        opts += [w for w in english_index if w.startswith(text)]
+        return opts[state] if state < len(opts) else None
+
+    readline.set_completer(completer)
+    readline.parse_and_bind("tab: complete")
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+
+def _save_history():
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
 
 def demo():
-    tree = AVLDict()
+    tree = SayingDict()
 
     # — INSERT five sayings —
     sample = [
@@ -31,8 +69,8 @@ def demo():
                "This saying outlines the values of Hawaiian family life.",
                "It promotes empathy and support."),
     ]
+    tree.bulk_load(sample)  # linear-time balanced build
     for s in sample:
-        tree.insert(s)
         index_saying(s)
         print("Inserted:", s.key)
 
@@ -66,10 +104,14 @@ def demo():
 
     # — USER INTERACTION —
     print("\n--- Search Mode ---")
+    _setup_readline()
+    instructions = "Modes: 'mehua' (Hawaiian word), 'withword' (English word), 'search' (several words), 'quit' to exit. Tab completes."
+    print(instructions)
     while True:
-        mode = input("\nSearch mode ('mehua' for Hawaiian word, 'withword' for English word, 'quit' to exit): ").strip().lower()
+        mode = input("\nSearch mode: ").strip().lower()
         if mode == 'quit':
             print("Exiting search mode.")
+            _save_history()
             break
         elif mode == 'mehua':
             word = input("Enter Hawaiian word to search for: ").strip()
@@ -89,8 +131,17 @@ def demo():
                     print(" •", r)
             else:
                 print("No sayings found with that English word.")
+        elif mode == 'search':
+            query = input("Enter one or more words (Hawaiian or English): ").strip()
+            results = search_multi(query)
+            if results:
+                print(f"Found {len(results)} result(s):")
+                for r in results:
+                    print(" •", r)
+            else:
+                print("No sayings found containing all of those words.")
         else:
-            print("Invalid mode. Try 'mehua', 'withword', or 'quit'.")
+            print("Invalid mode.", instructions)
 
 if __name__ == "__main__":
     demo()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""saying_dict.py
+
+A drop-in alternative to AVLDict backed by a binary-searched sorted list
+plus a hash map, built entirely on the stdlib bisect module.
+
+At the corpus sizes this project handles, a flat list kept sorted by the
+precomputed Hawaiian key beats a pure-Python tree on every operation:
+member/lookup is one dict probe, first/last are end-of-list reads,
+predecessor/successor are a C-level bisect each, and in-order iteration
+is just walking the list.  AVLDict remains the reference implementation
+of the assignment's Θ(log n) data structure.
+
+Author: Jaeke Barkin
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from avl_tree import Saying, _hawaiian_key
+
+
+class SayingDict:
+
+    def __init__(self):
+        self._keys: list[bytes] = []        # sorted Hawaiian keys
+        self._values: list[Saying] = []     # aligned with _keys
+        self._by_key: dict[bytes, Saying] = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key: str):  # Member()
+        return _hawaiian_key(key) in self._by_key
+
+    def __getitem__(self, key: str):
+        try:
+            return self._by_key[_hawaiian_key(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def insert(self, value: Saying):  # Insert()
+        """Insert or replace *value* keyed by its olelo_haw string."""
+        sk = value._sortkey
+        idx = bisect_left(self._keys, sk)
+        if idx < len(self._keys) and self._keys[idx] == sk:
+            self._values[idx] = value  # replace existing
+        else:
+            self._keys.insert(idx, sk)
+            self._values.insert(idx, value)
+        self._by_key[sk] = value
+
+    def bulk_load(self, sayings: Iterable[Saying]):
+        """Replace the contents with *sayings* in one sorted build.
+
+        Later duplicates win, matching insert's replacement behaviour.
+        """
+        by_key = {s._sortkey: s for s in sayings}
+        self._keys = sorted(by_key)
+        self._values = [by_key[k] for k in self._keys]
+        self._by_key = by_key
+
+    def first(self):  # First()
+        return self._values[0] if self._values else None
+
+    def last(self):  # Last()
+        return self._values[-1] if self._values else None
+
+    def predecessor(self, key: str):  # Predecessor()
+        idx = bisect_left(self._keys, _hawaiian_key(key))
+        return self._values[idx - 1] if idx > 0 else None
+
+    def successor(self, key: str):  # Successor()
+        idx = bisect_right(self._keys, _hawaiian_key(key))
+        return self._values[idx] if idx < len(self._values) else None
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def keys(self):
+        for saying in self:
+            yield saying.key
+
+    def values(self):
+        yield from self
@@ -2,40 +2,69 @@
 
 # Author: Michaela Gillan
 
+import sys
 import unicodedata
-from collections import defaultdict
-from avl_tree import Saying 
+from array import array
+from functools import lru_cache
+from avl_tree import Saying
 
 # Normalize word to help search operation. Deals with Olelo symbols for sorting/comparing.
+# Memoized – the vocabulary is small and queries repeat, so each distinct word
+# pays for NFKD only once; interning the result lets index dict lookups hit
+# the pointer-equality fast path.
+@lru_cache(maxsize=65536)
 def normalize(s):
-  return unicodedata.normalize('NFKD',s).lower()
+  return sys.intern(unicodedata.normalize('NFKD',s).casefold())
 
-# Index dictionaries
-non_english_index = defaultdict(list)  # e.g., "hana" -> [s1, s2, ...]
-english_index = defaultdict(list)      # e.g., "life" -> [s1, s3, ...]
+# Sayings are stored once in _sayings and referenced by integer id; each index
+# entry is a compact array('i') of ids instead of a list of object references.
+_sayings: list[Saying] = []
+non_english_index: dict[str, array] = {}  # e.g., "hana" -> array of saying ids
+english_index: dict[str, array] = {}      # e.g., "life" -> array of saying ids
 
 def index_saying(saying: Saying):
     """
     Indexes a Saying object by its words in both the olelo_haw and translation_en.
     """
+    sid = len(_sayings)
+    _sayings.append(saying)
+
     # Index Hawaiian words
     for word in saying.olelo_haw.split():
         normalized = normalize(word)
-        non_english_index[normalized].append(saying)
+        non_english_index.setdefault(normalized, array("i")).append(sid)
 
     # Index English translation words
     for word in saying.translation_en.split():
         normalized = word.lower()
-        english_index[normalized].append(saying)
+        english_index.setdefault(normalized, array("i")).append(sid)
 
 def mehua(word):
     """Return all sayings that contain the given Hawaiian word."""
-    return non_english_index.get(normalize(word), [])
+    return [_sayings[i] for i in non_english_index.get(normalize(word), ())]
 
 def withword(word):
     """Return all sayings that contain the given English word."""
-    return english_index.get(word.lower(), [])
+    return [_sayings[i] for i in english_index.get(word.lower(), ())]
 
-def withword(word):
-    """Return all sayings that contain the given English word."""
-    return english_index.get(word.lower(), [])
+def search_multi(query):
+    """Return all sayings containing every word of a multi-word query.
+
+    Each query word is a single O(1) lookup (Hawaiian index first, then
+    English) and the candidate id sets are intersected, so the cost is
+    linear in the query length rather than in the vocabulary size.
+    """
+    result_ids = None
+    for word in query.split():
+        ids = non_english_index.get(normalize(word))
+        if ids is None:
+            ids = english_index.get(word.lower())
+        if ids is None:
+            return []
+        found = set(ids)
+        result_ids = found if result_ids is None else result_ids & found
+        if not result_ids:
+            return []
+    if not result_ids:
+        return []
+    return [_sayings[i] for i in sorted(result_ids)]